@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from typing import Any
+
+from django.db import models
+from django.db.models import Prefetch, QuerySet
 
 from apps.core.licensing import get_minimum_display_rank
 from apps.core.types import JsonData
@@ -28,6 +32,35 @@ from .schemas import (
     TitleRef,
 )
 
+# ---------------------------------------------------------------------------
+# Queryset helpers
+# ---------------------------------------------------------------------------
+
+
+def deferred_descriptions(*relations: str) -> list[str]:
+    """Return ``defer()`` paths for the markdown ``description`` of a queryset's
+    model and of each select_related *relation*.
+
+    For reads that never render descriptions (list rows, facet data), so the
+    markdown bodies stay out of every joined row.
+    """
+    return ["description", *(f"{rel}__description" for rel in relations)]
+
+
+def slug_name_prefetch(
+    lookup: str, model: type[models.Model]
+) -> Prefetch[str, QuerySet[Any], str]:
+    """Prefetch *lookup* loading only ``pk``, ``slug`` and ``name``.
+
+    Enough for ``EntityRef``-style facet lists; skips descriptions and
+    the other columns of each related row.
+    """
+    return Prefetch(
+        lookup,
+        queryset=model._default_manager.only("pk", "slug", "name"),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Generic serialization helpers
 # ---------------------------------------------------------------------------
@@ -19,7 +19,7 @@ from pydantic import TypeAdapter
 from apps.core.authz.markers import requires
 from apps.core.authz.types import Activity
 from apps.core.licensing import get_minimum_display_rank
-from apps.core.pagination import NamedPageNumberPagination
+from apps.core.pagination import NamedPageNumberPagination, SerializedPage
 from apps.core.schemas import (
     ErrorDetailSchema,
     RateLimitErrorSchema,
@@ -82,8 +82,10 @@ from .edit_claims import (
 from .helpers import (
     _extract_variant_features,
     _get_feature_descendant_slugs,
+    deferred_descriptions,
     serialize_credit,
     serialize_title_machine,
+    slug_name_prefetch,
 )
 from .images import (
     extract_image_attribution,
@@ -240,10 +242,20 @@ def _build_model_list_qs(
             "corporate_entity__manufacturer",
             "technology_generation",
             "display_type",
-            "title",
+        )
+        # List rows never render descriptions; keep the markdown bodies
+        # (and the manufacturer's extra_data) out of every joined row.
+        .defer(
+            *deferred_descriptions(
+                "corporate_entity",
+                "corporate_entity__manufacturer",
+                "technology_generation",
+                "display_type",
+            ),
+            "corporate_entity__manufacturer__extra_data",
         )
         .prefetch_related(
-            "themes",
+            slug_name_prefetch("themes", Theme),
             Prefetch(
                 "entity_media",
                 queryset=EntityMedia.objects.filter(
@@ -635,7 +647,7 @@ def list_models(
     year_max: int | None = None,
     person: str = "",
     ordering: str = "-year",
-) -> list[ModelListItemSchema]:
+) -> SerializedPage[ModelListItemSchema]:
     qs = _build_model_list_qs(
         manufacturer=manufacturer,
         type=type,
@@ -653,7 +665,9 @@ def list_models(
         ordering=ordering,
     )
     min_rank = get_minimum_display_rank()
-    return [_serialize_model_list(pm, min_rank=min_rank) for pm in qs]
+    return SerializedPage(
+        qs, lambda page: [_serialize_model_list(pm, min_rank=min_rank) for pm in page]
+    )
 
 
 def _build_search_text(pm: MachineModel) -> str:
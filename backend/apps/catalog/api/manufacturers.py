@@ -20,7 +20,7 @@ from apps.core.authz.markers import requires
 from apps.core.authz.types import Activity
 from apps.core.licensing import get_minimum_display_rank
 from apps.core.models import active_status_q
-from apps.core.pagination import NamedPageNumberPagination
+from apps.core.pagination import NamedPageNumberPagination, SerializedPage
 from apps.core.schemas import ValidationErrorSchema
 from apps.media.helpers import all_media
 from apps.media.schemas import UploadedMediaSchema
@@ -261,12 +261,11 @@ class ManufacturerListPagination(NamedPageNumberPagination):
 
 @manufacturers_router.get("/", response=list[ManufacturerListItemSchema])
 @paginate(ManufacturerListPagination, page_size=DEFAULT_PAGE_SIZE)
-def list_manufacturers(request: HttpRequest) -> list[ManufacturerListItemSchema]:
-    return [
-        ManufacturerListItemSchema(
-            name=row["name"], slug=row["slug"], model_count=row["model_count"]
-        )
-        for row in Manufacturer.objects.active()
+def list_manufacturers(
+    request: HttpRequest,
+) -> SerializedPage[ManufacturerListItemSchema]:
+    qs = (
+        Manufacturer.objects.active()
         .annotate(
             model_count=Count(
                 "entities__models",
@@ -275,7 +274,16 @@ def list_manufacturers(request: HttpRequest) -> list[ManufacturerListItemSchema]
         )
         .order_by("name")
         .values("name", "slug", "model_count")
-    ]
+    )
+    return SerializedPage(
+        qs,
+        lambda page: [
+            ManufacturerListItemSchema(
+                name=row["name"], slug=row["slug"], model_count=row["model_count"]
+            )
+            for row in page
+        ],
+    )
 
 
 @manufacturers_router.get("/all/", response=list[ManufacturerGridItemSchema])
@@ -22,7 +22,7 @@ from apps.core.authz.markers import requires
 from apps.core.authz.types import Activity
 from apps.core.licensing import get_minimum_display_rank
 from apps.core.models import active_status_q
-from apps.core.pagination import NamedPageNumberPagination
+from apps.core.pagination import NamedPageNumberPagination, SerializedPage
 from apps.core.schemas import (
     ErrorDetailSchema,
     RateLimitErrorSchema,
@@ -229,16 +229,22 @@ class PersonListPagination(NamedPageNumberPagination):
 
 @people_router.get("/", response=list[PersonListItemSchema])
 @paginate(PersonListPagination, page_size=DEFAULT_PAGE_SIZE)
-def list_people(request: HttpRequest) -> list[PersonListItemSchema]:
-    return [
-        PersonListItemSchema(
-            name=row["name"], slug=row["slug"], credit_count=row["credit_count"]
-        )
-        for row in Person.objects.active()
+def list_people(request: HttpRequest) -> SerializedPage[PersonListItemSchema]:
+    qs = (
+        Person.objects.active()
         .annotate(credit_count=Count("credits"))
         .order_by("name")
         .values("name", "slug", "credit_count")
-    ]
+    )
+    return SerializedPage(
+        qs,
+        lambda page: [
+            PersonListItemSchema(
+                name=row["name"], slug=row["slug"], credit_count=row["credit_count"]
+            )
+            for row in page
+        ],
+    )
 
 
 @people_router.get("/all/", response=list[PersonGridItemSchema])
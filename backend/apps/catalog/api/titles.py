@@ -17,7 +17,9 @@ from django.db.models import (
     Q,
     QuerySet,
     Subquery,
+    Value,
 )
+from django.db.models.functions import Lower
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404
 from django.views.decorators.cache import cache_control
@@ -33,7 +35,7 @@ from apps.core.authz.markers import requires
 from apps.core.authz.types import Activity
 from apps.core.licensing import get_minimum_display_rank
 from apps.core.models import active_status_q
-from apps.core.pagination import NamedPageNumberPagination
+from apps.core.pagination import NamedPageNumberPagination, SerializedPage
 from apps.core.schemas import (
     ErrorDetailSchema,
     RateLimitErrorSchema,
@@ -59,8 +61,11 @@ from apps.provenance.schemas import (
 from ..cache import get_cached_response, set_cached_response, titles_all_key
 from ..models import (
     Credit,
+    GameplayFeature,
     MachineModel,
     MachineModelGameplayFeature,
+    RewardType,
+    Theme,
     Title,
     TitleAbbreviation,
 )
@@ -82,8 +87,10 @@ from .entity_create import (
 )
 from .helpers import (
     _intersect_facet_sets,
+    deferred_descriptions,
     serialize_credit,
     serialize_title_machine,
+    slug_name_prefetch,
 )
 from .images import extract_image_urls, fetch_model_media_map, media_prefetch
 from .machine_models import (
@@ -366,7 +373,11 @@ def _build_review_links(title: Title) -> list[ReviewLinkSchema]:
     base_name = re.sub(r"\s*\([^)]*\)\s*$", "", title.name).strip()
     related = (
         Title.objects.active()
-        .filter(Q(name__iexact=title.name) | Q(name__iexact=base_name))
+        .annotate(lower_name=Lower("name"))
+        .filter(
+            Q(lower_name=Lower(Value(title.name)))
+            | Q(lower_name=Lower(Value(base_name)))
+        )
         .exclude(pk=title.pk)
         .exclude(opdb_id__isnull=True)
     )
@@ -657,16 +668,34 @@ def _title_models_prefetch() -> Prefetch[str, Any, str]:
             "converted_from__title",
             "remake_of__title",
         )
+        # Title pages render only the title's own description.
+        .defer(
+            *deferred_descriptions(
+                "corporate_entity",
+                "corporate_entity__manufacturer",
+                "technology_generation",
+                "technology_subgeneration",
+                "display_type",
+                "display_subtype",
+                "system",
+                "cabinet",
+                "game_format",
+                "converted_from",
+                "converted_from__title",
+                "remake_of",
+                "remake_of__title",
+            )
+        )
         .prefetch_related(
-            "themes",
-            "gameplay_features",
+            slug_name_prefetch("themes", Theme),
+            slug_name_prefetch("gameplay_features", GameplayFeature),
             Prefetch(
                 "machinemodelgameplayfeature_set",
                 queryset=MachineModelGameplayFeature.objects.select_related(
                     "gameplayfeature"
                 ),
             ),
-            "reward_types",
+            slug_name_prefetch("reward_types", RewardType),
             "tags",
             "credits__person",
             "credits__role",
@@ -703,7 +732,9 @@ class TitleListPagination(NamedPageNumberPagination):
 
 @titles_router.get("/", response=list[TitleListItemSchema])
 @paginate(TitleListPagination, page_size=DEFAULT_PAGE_SIZE)
-def list_titles(request: HttpRequest, display: str = "") -> list[TitleListItemSchema]:
+def list_titles(
+    request: HttpRequest, display: str = ""
+) -> SerializedPage[TitleListItemSchema]:
     qs = Title.objects.active().annotate(
         model_count=Count(
             "machine_models",
@@ -715,20 +746,24 @@ def list_titles(request: HttpRequest, display: str = "") -> list[TitleListItemSc
         qs = qs.filter(machine_models__display_type__slug=display).distinct()
     qs = (
         qs.select_related("franchise", "series")
+        .defer(*deferred_descriptions("franchise", "series"))
         .prefetch_related(_title_models_prefetch(), "abbreviations")
         .order_by("name")
     )
     min_rank = get_minimum_display_rank()
-    titles = list(qs)
-    media_by_model = fetch_model_media_map(
-        first.pk
-        for t in titles
-        if (first := next(iter(t.machine_models.all()), None)) is not None
-    )
-    return [
-        _serialize_title_list(t, min_rank=min_rank, media_by_model=media_by_model)
-        for t in titles
-    ]
+
+    def serialize(titles: list[Title]) -> list[TitleListItemSchema]:
+        media_by_model = fetch_model_media_map(
+            first.pk
+            for t in titles
+            if (first := next(iter(t.machine_models.all()), None)) is not None
+        )
+        return [
+            _serialize_title_list(t, min_rank=min_rank, media_by_model=media_by_model)
+            for t in titles
+        ]
+
+    return SerializedPage(qs, serialize)
 
 
 @titles_router.get("/all/", response=list[TitleListItemSchema])
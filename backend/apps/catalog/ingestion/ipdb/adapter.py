@@ -442,7 +442,7 @@ def parse_ipdb_records(ipdb_path: str) -> list[IpdbRecord]:
 
 def get_or_create_source() -> Source:
     """Get or create the IPDB source."""
-    source, _ = Source.objects.update_or_create(
+    source = Source.objects.ensure(
         slug="ipdb",
         defaults={
             "name": "IPDB",
@@ -559,7 +559,7 @@ def parse_opdb_records(raw_data: list[dict[str, Any]]) -> list[OpdbRecord]:
 
 def get_or_create_source() -> Source:
     """Get or create the OPDB source."""
-    source, _ = Source.objects.update_or_create(
+    source = Source.objects.ensure(
         slug="opdb",
         defaults={
             "name": "OPDB",
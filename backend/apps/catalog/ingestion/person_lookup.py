@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import logging
 
+from django.db.models import QuerySet
+
 from apps.catalog.models import Person, PersonAlias
 
 logger = logging.getLogger(__name__)
 
 
-def build_person_lookup() -> dict[str, Person]:
+def build_person_lookup(
+    persons: QuerySet[Person] | None = None,
+) -> dict[str, Person]:
     """Return a ``{name.lower(): Person}`` dict including aliases.
 
     External ingest commands (IPDB, OPDB, Fandom, etc.) use this to match
@@ -20,19 +24,29 @@ def build_person_lookup() -> dict[str, Person]:
     On collision (alias value matches an existing person's canonical name
     or another alias pointing to a different person), the alias is skipped
     with a warning.
-    """
-    lookup: dict[str, Person] = {p.name.lower(): p for p in Person.objects.all()}
 
-    for alias in PersonAlias.objects.select_related("person").all():
-        key = alias.value.lower()
-        if key in lookup and lookup[key] != alias.person:
+    *persons* lets callers pass an annotated queryset (e.g. with
+    ``has_credits``); alias keys resolve to the same instances, so the
+    annotations are visible whichever spelling matched.
+    """
+    if persons is None:
+        persons = Person.objects.all()
+    by_pk: dict[int, Person] = {p.pk: p for p in persons}
+    lookup: dict[str, Person] = {p.name.lower(): p for p in by_pk.values()}
+
+    for value, person_id in PersonAlias.objects.values_list("value", "person_id"):
+        person = by_pk.get(person_id)
+        if person is None:
+            continue
+        key = value.lower()
+        if key in lookup and lookup[key] != person:
             logger.warning(
                 "Alias %r for %s collides with existing person %s — skipping",
-                alias.value,
-                alias.person.name,
+                value,
+                person.name,
                 lookup[key].name,
             )
             continue
-        lookup[key] = alias.person
+        lookup[key] = person
 
     return lookup
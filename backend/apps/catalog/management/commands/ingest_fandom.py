@@ -34,6 +34,7 @@ from typing import Any
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from apps.catalog.claims import build_relationship_claim, make_authoritative_scope
 from apps.catalog.ingestion.bulk_utils import ManufacturerResolver, generate_unique_slug
@@ -185,7 +186,7 @@ class Command(BaseCommand):
         # ------------------------------------------------------------------
         # 5. Upsert Fandom source (priority=20 — lowest, loses to all others).
         # ------------------------------------------------------------------
-        source, _ = Source.objects.update_or_create(
+        source = Source.objects.ensure(
             slug="fandom",
             defaults={
                 "name": "Pinball Wiki (Fandom)",
@@ -276,23 +277,26 @@ class Command(BaseCommand):
                     f"{credit.role} on {machine.name}"
                 )
 
-        if credit_claims:
-            auth_scope = make_authoritative_scope(MachineModel, matched_machine_ids)
-            credit_stats = Claim.objects.bulk_assert_claims(
-                source,
-                credit_claims,
-                sweep_field="credit",
-                authoritative_scope=auth_scope,
-            )
-            self.stdout.write(
-                f"  Credit claims: {credit_stats['unchanged']} unchanged, "
-                f"{credit_stats['created']} created, "
-                f"{credit_stats['superseded']} superseded, "
-                f"{credit_stats['swept']} swept"
-            )
+        # Assert and materialize together so a failed resolve can't leave
+        # credit claims without their Credit rows.
+        with transaction.atomic():
+            if credit_claims:
+                auth_scope = make_authoritative_scope(MachineModel, matched_machine_ids)
+                credit_stats = Claim.objects.bulk_assert_claims(
+                    source,
+                    credit_claims,
+                    sweep_field="credit",
+                    authoritative_scope=auth_scope,
+                )
+                self.stdout.write(
+                    f"  Credit claims: {credit_stats['unchanged']} unchanged, "
+                    f"{credit_stats['created']} created, "
+                    f"{credit_stats['superseded']} superseded, "
+                    f"{credit_stats['swept']} swept"
+                )
 
-        # Resolve credit claims into materialized Credit rows.
-        resolve_all_credits(subject_ids=matched_machine_ids)
+            # Resolve credit claims into materialized Credit rows.
+            resolve_all_credits(subject_ids=matched_machine_ids)
 
         # ------------------------------------------------------------------
         # 8. Ingest persons.
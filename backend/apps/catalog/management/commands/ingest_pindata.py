@@ -431,7 +431,7 @@ class Command(BaseCommand):
         self.export_dir = Path(options["export_dir"])
 
         # Create sources used across phases.
-        self.flipcommons_source, _ = Source.objects.update_or_create(
+        self.flipcommons_source = Source.objects.ensure(
             slug="flipcommons-catalog",
             defaults={
                 "name": "Flipcommons Catalog",
@@ -448,7 +448,7 @@ class Command(BaseCommand):
             plural = str(
                 model_class._meta.verbose_name_plural or model_class.__name__
             ).title()
-            src, _ = Source.objects.update_or_create(
+            src = Source.objects.ensure(
                 slug=f"flipcommons-ai-desc-{slug_suffix}",
                 defaults={
                     "name": f"Flipcommons AI Descriptions ({model_class.__name__})",
@@ -464,22 +464,26 @@ class Command(BaseCommand):
         # Defer them until all entities exist so the lookups succeed.
         self._deferred_desc_claims: list[tuple[type[CatalogModel], Claim]] = []
 
-        for phase in [
-            self._ingest_locations,
-            self._ingest_taxonomy,
-            self._ingest_themes,
-            self._ingest_gameplay_features,
-            self._sync_reward_type_aliases,
-            self._ingest_manufacturers,
-            self._ingest_corporate_entities,
-            self._ingest_systems,
-            self._ingest_people,
-            self._ingest_series,
-            self._ingest_titles,
-            self._ingest_models,
-            self._flush_deferred_descriptions,
-        ]:
-            self._run_timed(phase)
+        # One transaction for the whole load: a single commit instead of one
+        # per autocommitted statement, and a failed phase leaves no partial
+        # catalog behind.
+        with transaction.atomic():
+            for phase in [
+                self._ingest_locations,
+                self._ingest_taxonomy,
+                self._ingest_themes,
+                self._ingest_gameplay_features,
+                self._sync_reward_type_aliases,
+                self._ingest_manufacturers,
+                self._ingest_corporate_entities,
+                self._ingest_systems,
+                self._ingest_people,
+                self._ingest_series,
+                self._ingest_titles,
+                self._ingest_models,
+                self._flush_deferred_descriptions,
+            ]:
+                self._run_timed(phase)
 
         self.stdout.write(self.style.SUCCESS("Ingestion complete."))
 
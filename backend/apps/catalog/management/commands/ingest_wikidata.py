@@ -22,7 +22,12 @@ from typing import Any
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Value
+from django.db.models.functions import Lower
+from django.utils import timezone
 
+from apps.catalog.cache import invalidate_all
 from apps.catalog.claims import build_relationship_claim, make_authoritative_scope
 from apps.catalog.ingestion.person_lookup import build_person_lookup
 from apps.catalog.ingestion.wikidata_sparql import (
@@ -31,7 +36,7 @@ from apps.catalog.ingestion.wikidata_sparql import (
     parse_sparql_results,
     parse_wikidata_date,
 )
-from apps.catalog.models import CreditRole, MachineModel, Person
+from apps.catalog.models import Credit, CreditRole, MachineModel, Person
 from apps.catalog.resolve import (
     resolve_all_credits,
     resolve_all_entities,
@@ -66,6 +71,7 @@ class Command(BaseCommand):
     ) -> None:
         dump_path = options["dump"]
         from_dump = options["from_dump"]
+        verbose = options["verbosity"] >= 2
 
         # 1. Fetch or load SPARQL data.
         if from_dump:
@@ -86,8 +92,19 @@ class Command(BaseCommand):
         wikidata_persons = parse_sparql_results(raw_data)
         self.stdout.write(f"  Found {len(wikidata_persons)} persons in Wikidata")
 
+        # Steps 4-10 write; run them as one transaction so a re-run either
+        # lands completely or not at all, and Postgres commits once.
+        with transaction.atomic():
+            self._ingest_persons(wikidata_persons, verbose=verbose)
+
+        # 11. Summary.
+        self.stdout.write(self.style.SUCCESS("Wikidata ingestion complete."))
+
+    def _ingest_persons(
+        self, wikidata_persons: list[WikidataPerson], *, verbose: bool
+    ) -> None:
         # 4. Upsert Wikidata source.
-        source, _ = Source.objects.update_or_create(
+        source = Source.objects.ensure(
             slug="wikidata",
             defaults={
                 "name": "Wikidata",
@@ -97,18 +114,20 @@ class Command(BaseCommand):
             },
         )
 
-        # 5. Load existing Person records and a set of person PKs that have credits.
-        from apps.catalog.models import Credit
-
-        existing_persons = build_person_lookup()
-        persons_with_credits: set[int] = set(
-            Credit.objects.values_list("person_id", flat=True).distinct()
-        )
+        # 5. Load existing Person records. Only the columns read below — Person
+        # carries wide text/JSON fields. The has_credits annotation only feeds
+        # the match report, so skip the EXISTS subquery when it isn't printed.
+        persons = Person.objects.only("pk", "name", "wikidata_id")
+        if verbose:
+            persons = persons.annotate(
+                has_credits=Exists(Credit.objects.filter(person_id=OuterRef("pk")))
+            )
+        existing_persons = build_person_lookup(persons)
 
         ct_id = ContentType.objects.get_for_model(Person).pk
 
-        # 6 + 7. Match, score, report, collect claims.
-        self.stdout.write("\nWikidata match report:")
+        # 6 + 7. Match, score, report (at -v 2), collect claims.
+        report_lines: list[str] = ["\nWikidata match report:"] if verbose else []
         pending_claims: list[Claim] = []
         matched_pairs: list[tuple[WikidataPerson, Person]] = []
         matched_count = 0
@@ -118,18 +137,26 @@ class Command(BaseCommand):
             person = existing_persons.get(wp.name.lower())
             if person is None:
                 unmatched_count += 1
-                self.stdout.write(f"  [NO MATCH]   {wp.name} ({wp.qid})")
+                if verbose:
+                    report_lines.append(f"  [NO MATCH]   {wp.name} ({wp.qid})")
                 continue
 
-            confidence, reason = _calculate_confidence(wp, person, persons_with_credits)
-            self.stdout.write(
-                f"  [MATCH {confidence:.2f}] {wp.name} ({wp.qid}) — {reason}"
-            )
+            if verbose:
+                confidence, reason = _calculate_confidence(
+                    wp, getattr(person, "has_credits", False)
+                )
+                report_lines.append(
+                    f"  [MATCH {confidence:.2f}] {wp.name} ({wp.qid}) — {reason}"
+                )
 
             pending_claims.extend(_collect_person_claims(wp, person, ct_id))
             matched_pairs.append((wp, person))
             matched_count += 1
 
+        # One write for the whole report rather than one per row.
+        if report_lines:
+            self.stdout.write("\n".join(report_lines))
+
         # 8. Bulk-assert all claims.
         if pending_claims:
             stats = Claim.objects.bulk_assert_claims(source, pending_claims)
@@ -143,10 +170,21 @@ class Command(BaseCommand):
             self.stdout.write("\n  Claims: 0 (no matches)")
 
         # 9. Set wikidata_id on matched persons.
+        # Keyed by pk: two Wikidata rows can match the same person via aliases.
+        now = timezone.now()
+        persons_to_update: dict[int, Person] = {}
         for wp, person in matched_pairs:
             if person.wikidata_id != wp.qid:
                 person.wikidata_id = wp.qid
-                person.save(update_fields=["wikidata_id", "updated_at"])
+                # auto_now is not triggered by bulk_update.
+                person.updated_at = now
+                persons_to_update[person.pk] = person
+        if persons_to_update:
+            Person.objects.bulk_update(
+                persons_to_update.values(), ["wikidata_id", "updated_at"]
+            )
+            # bulk_update skips the post_save cache-invalidation signal.
+            transaction.on_commit(invalidate_all)
 
         # Bulk-resolve claims into Person fields.
         matched_person_ids = {person.pk for _wp, person in matched_pairs}
@@ -156,9 +194,21 @@ class Command(BaseCommand):
         )
 
         # 10. Assert credit relationship claims for matched (machine, person) pairs.
-        existing_machines: dict[str, MachineModel] = {
-            m.name.lower(): m for m in MachineModel.objects.all()
+        # Only fetch machines named by an incoming credit, and only pk + name
+        # (credit resolution below works from pks).  Both sides are lowered
+        # by the database so backends that only fold ASCII (SQLite) still
+        # compare like with like; the exact match is then done in Python.
+        wanted_labels = {
+            credit.work_label for wp, _person in matched_pairs for credit in wp.credits
         }
+        existing_machines: dict[str, MachineModel] = {}
+        if wanted_labels:
+            existing_machines = {
+                m.name.lower(): m
+                for m in MachineModel.objects.annotate(lower_name=Lower("name"))
+                .filter(lower_name__in=[Lower(Value(label)) for label in wanted_labels])
+                .only("pk", "name")
+            }
         ct_machine = ContentType.objects.get_for_model(MachineModel).pk
         role_slug_to_pk: dict[str, int] = dict(
             CreditRole.objects.values_list("slug", "pk")
@@ -219,15 +269,12 @@ class Command(BaseCommand):
         if unmatched_machines:
             self.stdout.write(f"  Unmatched machines: {sorted(unmatched_machines)}")
 
-        # 11. Summary.
         self.stdout.write(f"\n  Matched: {matched_count}, Unmatched: {unmatched_count}")
-        self.stdout.write(self.style.SUCCESS("Wikidata ingestion complete."))
 
 
 def _calculate_confidence(
     wp: WikidataPerson,
-    person: Person,
-    persons_with_credits: set[int],
+    has_credits: bool,
 ) -> tuple[float, str]:
     """Return (confidence, reason) for a name-matched Wikidata person.
 
@@ -236,7 +283,7 @@ def _calculate_confidence(
     our DB is meaningful.  We boost confidence when the person already
     has credits in our DB, confirming they're active in the pinball world.
     """
-    if person.pk in persons_with_credits:
+    if has_credits:
         return 0.95, "name match; person has credits in DB"
     return 0.85, "name match; person has no credits in DB to verify"
 
@@ -271,19 +318,22 @@ def _collect_person_claims(
     if wp.description:
         add("wikidata.description", wp.description)
 
-    birth_year, birth_month, birth_day = parse_wikidata_date(
-        wp.birth_date, wp.birth_precision
-    )
-    add("birth_year", birth_year)
-    add("birth_month", birth_month)
-    add("birth_day", birth_day)
-
-    death_year, death_month, death_day = parse_wikidata_date(
-        wp.death_date, wp.death_precision
-    )
-    add("death_year", death_year)
-    add("death_month", death_month)
-    add("death_day", death_day)
+    # Most persons lack one or both dates; skip parsing when there's nothing to parse.
+    if wp.birth_date:
+        birth_year, birth_month, birth_day = parse_wikidata_date(
+            wp.birth_date, wp.birth_precision
+        )
+        add("birth_year", birth_year)
+        add("birth_month", birth_month)
+        add("birth_day", birth_day)
+
+    if wp.death_date:
+        death_year, death_month, death_day = parse_wikidata_date(
+            wp.death_date, wp.death_precision
+        )
+        add("death_year", death_year)
+        add("death_month", death_month)
+        add("death_day", death_day)
 
     add("birth_place", wp.birth_place)
     add("nationality", wp.nationality)
@@ -23,7 +23,10 @@ from typing import Any
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
 
+from apps.catalog.cache import invalidate_all
 from apps.catalog.ingestion.bulk_utils import ManufacturerResolver
 from apps.catalog.ingestion.wikidata_sparql import (
     WikidataManufacturer,
@@ -36,6 +39,14 @@ from apps.provenance.models import Claim, Source
 
 logger = logging.getLogger(__name__)
 
+# Match-report tag per match strategy, in resolution priority order.
+_MATCH_TAGS: dict[str, str] = {
+    "wikidata_id": "MATCH:QID",
+    "exact": "MATCH",
+    "entity": "MATCH:CE",
+    "normalized": "MATCH~",
+}
+
 
 class Command(BaseCommand):
     help = "Ingest pinball manufacturer data from Wikidata via SPARQL."
@@ -69,6 +80,7 @@ class Command(BaseCommand):
     ) -> None:
         dump_path = options["dump"]
         from_dump = options["from_dump"]
+        verbose = options["verbosity"] >= 2
 
         timeout = options["timeout"]
 
@@ -95,8 +107,21 @@ class Command(BaseCommand):
             f"  Found {len(wikidata_manufacturers)} manufacturers in Wikidata"
         )
 
+        # Steps 4-9 write; run them as one transaction so a re-run either
+        # lands completely or not at all, and Postgres commits once.
+        with transaction.atomic():
+            self._ingest_manufacturers(wikidata_manufacturers, verbose=verbose)
+
+        # 10. Summary.
+        self.stdout.write(
+            self.style.SUCCESS("Wikidata manufacturer ingestion complete.")
+        )
+
+    def _ingest_manufacturers(
+        self, wikidata_manufacturers: list[WikidataManufacturer], *, verbose: bool
+    ) -> None:
         # 4. Upsert Wikidata source.
-        source, _ = Source.objects.update_or_create(
+        source = Source.objects.ensure(
             slug="wikidata",
             defaults={
                 "name": "Wikidata",
@@ -110,8 +135,8 @@ class Command(BaseCommand):
         resolver = ManufacturerResolver()
         ct_id = ContentType.objects.get_for_model(Manufacturer).pk
 
-        # 6. Match, report, collect claims.
-        self.stdout.write("\nWikidata match report:")
+        # 6. Match, report (at -v 2), collect claims.
+        report_lines: list[str] = ["\nWikidata match report:"] if verbose else []
         pending_claims: list[Claim] = []
         matched_pairs: list[tuple[WikidataManufacturer, Manufacturer]] = []
         matched_count = 0
@@ -135,20 +160,21 @@ class Command(BaseCommand):
                 match_type = "normalized"
             if mfr is None:
                 unmatched_count += 1
-                self.stdout.write(f"  [NO MATCH]  {wm.name} ({wm.qid})")
+                if verbose:
+                    report_lines.append(f"  [NO MATCH]  {wm.name} ({wm.qid})")
                 continue
 
-            tag = {
-                "wikidata_id": "MATCH:QID",
-                "exact": "MATCH",
-                "entity": "MATCH:CE",
-                "normalized": "MATCH~",
-            }[match_type]
-            self.stdout.write(f"  [{tag:10s}] {wm.name} ({wm.qid}) → {mfr.name}")
+            if verbose:
+                tag = _MATCH_TAGS[match_type]
+                report_lines.append(f"  [{tag:10s}] {wm.name} ({wm.qid}) → {mfr.name}")
             pending_claims.extend(_collect_manufacturer_claims(wm, mfr, ct_id))
             matched_pairs.append((wm, mfr))
             matched_count += 1
 
+        # One write for the whole report rather than one per row.
+        if report_lines:
+            self.stdout.write("\n".join(report_lines))
+
         # 7. Bulk-assert all claims.
         if pending_claims:
             stats = Claim.objects.bulk_assert_claims(source, pending_claims)
@@ -162,10 +188,21 @@ class Command(BaseCommand):
             self.stdout.write("\n  Claims: 0 (no matches)")
 
         # 8. Set wikidata_id on matched manufacturers.
+        # Keyed by pk: several Wikidata rows can resolve to one manufacturer.
+        now = timezone.now()
+        mfrs_to_update: dict[int, Manufacturer] = {}
         for wm, mfr in matched_pairs:
             if mfr.wikidata_id != wm.qid:
                 mfr.wikidata_id = wm.qid
-                mfr.save(update_fields=["wikidata_id", "updated_at"])
+                # auto_now is not triggered by bulk_update.
+                mfr.updated_at = now
+                mfrs_to_update[mfr.pk] = mfr
+        if mfrs_to_update:
+            Manufacturer.objects.bulk_update(
+                mfrs_to_update.values(), ["wikidata_id", "updated_at"]
+            )
+            # bulk_update skips the post_save cache-invalidation signal.
+            transaction.on_commit(invalidate_all)
 
         # 9. Bulk-resolve claims into Manufacturer fields.
         matched_mfr_ids = {mfr.pk for _wm, mfr in matched_pairs}
@@ -174,11 +211,7 @@ class Command(BaseCommand):
             object_ids=matched_mfr_ids,
         )
 
-        # 10. Summary.
         self.stdout.write(f"\n  Matched: {matched_count}, Unmatched: {unmatched_count}")
-        self.stdout.write(
-            self.style.SUCCESS("Wikidata manufacturer ingestion complete.")
-        )
 
 
 def _collect_manufacturer_claims(
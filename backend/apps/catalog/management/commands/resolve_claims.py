@@ -6,6 +6,7 @@ import logging
 from typing import Any
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from apps.catalog.resolve import resolve_machine_models
 
@@ -23,7 +24,8 @@ class Command(BaseCommand):
         logging.getLogger("django.db.backends").setLevel(logging.WARNING)
 
         self.stdout.write("Resolving machine model claims...")
-        model_count = resolve_machine_models(stdout=self.stdout)
+        with transaction.atomic():
+            model_count = resolve_machine_models(stdout=self.stdout)
         self.stdout.write(self.style.SUCCESS(f"Resolved {model_count} models."))
 
         from apps.catalog.cache import invalidate_all
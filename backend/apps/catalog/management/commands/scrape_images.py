@@ -183,7 +183,7 @@ class Command(BaseCommand):
         year_min = options["year_min"]
         dry_run = options["dry_run"]
 
-        source, _ = Source.objects.update_or_create(
+        source = Source.objects.ensure(
             slug="web-scrape",
             defaults={
                 "name": "Web Scrape",
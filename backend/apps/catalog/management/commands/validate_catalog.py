@@ -48,7 +48,7 @@ def _winning_claims(content_type: ContentType, field_name: str) -> list[Claim]:
     priority, then most recent created_at as tiebreaker.  Only the winning
     claim per claim_key per object is returned.
     """
-    from django.db.models import Case, IntegerField, Value, When
+    from apps.provenance.helpers import effective_priority
 
     claims = (
         Claim.objects.filter(
@@ -57,14 +57,7 @@ def _winning_claims(content_type: ContentType, field_name: str) -> list[Claim]:
             field_name=field_name,
         )
         .select_related("source", "user")
-        .annotate(
-            effective_priority=Case(
-                When(source__isnull=False, then=F("source__priority")),
-                When(user__isnull=False, then=F("user__priority")),
-                default=Value(0),
-                output_field=IntegerField(),
-            )
-        )
+        .annotate(effective_priority=effective_priority())
         .order_by("object_id", "claim_key", "-effective_priority", "-created_at")
     )
 
@@ -0,0 +1,25 @@
+# Generated by Django 6.0.3 on 2026-10-17 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0003_alter_location_description'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='machinemodel',
+            index=models.Index(fields=['name'], name='catalog_mac_name_f3c4b0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(fields=['name'], name='catalog_per_name_7c62e6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='title',
+            index=models.Index(fields=['name'], name='catalog_tit_name_4d2bd4_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.3 on 2026-10-17 09:40
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0004_machinemodel_catalog_mac_name_f3c4b0_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='machinemodel',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='catalog_mm_lower_name_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.3 on 2026-10-17 10:05
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0005_machinemodel_catalog_mm_lower_name_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='machinemodel',
+            name='catalog_mac_display_2a6560_idx',
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.3 on 2026-10-17 11:02
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0006_remove_machinemodel_catalog_mac_display_2a6560_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='title',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='catalog_title_lower_name_idx'),
+        ),
+    ]
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 from django.contrib.contenttypes.fields import GenericRelation
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models.functions import Lower
 
 from apps.core.markdown import MarkdownField
 from apps.core.models import (
@@ -381,7 +382,8 @@ class MachineModel(
         indexes = [
             models.Index(fields=["corporate_entity", "year"]),
             models.Index(fields=["technology_generation", "year"]),
-            models.Index(fields=["display_type"]),
+            models.Index(fields=["name"]),
+            models.Index(Lower("name"), name="catalog_mm_lower_name_idx"),
         ]
 
     def __str__(self) -> str:
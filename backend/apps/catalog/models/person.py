@@ -195,6 +195,9 @@ class Person(
                 violation_error_code="cross_field",
             ),
         ]
+        indexes = [
+            models.Index(fields=["name"]),
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, ClassVar
 
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.db.models.functions import Lower
 
 from apps.core.markdown import MarkdownField
 from apps.core.models import (
@@ -121,6 +122,10 @@ class Title(
                 name="catalog_title_fandom_page_id_min",
             ),
         ]
+        indexes = [
+            models.Index(fields=["name"]),
+            models.Index(Lower("name"), name="catalog_title_lower_name_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.name
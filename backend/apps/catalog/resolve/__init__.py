@@ -34,10 +34,12 @@ from ._entities import (
     resolve_entity,
 )
 from ._helpers import (
+    CLAIM_CHUNK_SIZE,
     FKInfo,
     _annotate_priority,
     _coerce,
     _resolve_fk_generic,
+    _winning_claims,
     build_fk_info,
     get_field_defaults,
     get_preserve_fields,
@@ -252,6 +254,17 @@ def resolve_machine_models(stdout: OutputWrapper | None = None) -> int:
     all_models = list(MachineModel.objects.all())
     pre_slugs = {pm.pk: pm.slug for pm in all_models}
 
+    # Snapshot written columns (FKs by attname) so unchanged rows can be
+    # skipped at write time.
+    tracked_attnames = [
+        MachineModel._meta.get_field(attr).attname for attr in claim_fields.values()
+    ]
+    tracked_attnames.append("extra_data")
+    pre_values = {
+        pm.pk: [getattr(pm, attname) for attname in tracked_attnames]
+        for pm in all_models
+    }
+
     # 4. Resolve each model in memory.
     for pm in all_models:
         winners = claims_by_model.get(pm.pk, {})
@@ -269,24 +282,28 @@ def resolve_machine_models(stdout: OutputWrapper | None = None) -> int:
     resolve_unique_conflicts(all_models, "opdb_id", MachineModel)
     resolve_unique_conflicts(all_models, "slug", MachineModel, pre_slugs)
 
-    # 6. Validate check constraints before writing.
-    for pm in all_models:
-        validate_check_constraints(pm)
-
-    # 7. Set updated_at (auto_now not triggered by bulk_update).
+    # 6. Keep only models whose resolved values differ from the database;
+    # re-resolving an unchanged catalog then writes nothing. Changed models
+    # are validated against check constraints and stamped with updated_at
+    # (auto_now is not triggered by bulk_update) in the same pass.
     now = timezone.now()
+    changed_models: list[MachineModel] = []
     for pm in all_models:
+        if [getattr(pm, attname) for attname in tracked_attnames] == pre_values[pm.pk]:
+            continue
+        validate_check_constraints(pm)
         pm.updated_at = now
+        changed_models.append(pm)
 
-    # 8. Bulk write (~1 query, batched).
+    # 7. Bulk write (~1 query, batched).
     update_fields = [*claim_fields.values(), "extra_data", "updated_at"]
     # batch_size=100 is optimal for SQLite (CASE WHEN overhead grows with
     # batch size × field count). PostgreSQL uses a more efficient UPDATE FROM
     # VALUES syntax and handles larger batches fine.
-    MachineModel.objects.bulk_update(all_models, update_fields, batch_size=100)
-    _status(f"Wrote {len(all_models)} models")
+    MachineModel.objects.bulk_update(changed_models, update_fields, batch_size=100)
+    _status(f"Wrote {len(changed_models)} of {len(all_models)} models")
 
-    # 9. Bulk-resolve relationship claims.
+    # 8. Bulk-resolve relationship claims.
     all_model_ids = {pm.pk for pm in all_models}
     resolve_all_credits(subject_ids=all_model_ids)
     _status("Credits resolved")
@@ -323,17 +340,16 @@ def _build_claims_by_model() -> dict[int, dict[str, Claim]]:
 
     ct = ContentType.objects.get_for_model(MachineModel)
     claims = (
-        _annotate_priority(Claim.objects.filter(content_type=ct))
+        _winning_claims(_annotate_priority(Claim.objects.filter(content_type=ct)))
         .select_related("source__default_license")
-        .order_by("object_id", "claim_key", "-effective_priority", "-created_at")  # type: ignore[misc]
+        .order_by("object_id", "claim_key")
     )
 
+    # Superseded-by-priority claims are filtered out in SQL, so each row
+    # streamed here is the winner for its (object_id, claim_key).
     result: dict[int, dict[str, Claim]] = {}
-    for claim in claims:
-        model_winners = result.setdefault(claim.object_id, {})
-        # First claim per (object_id, claim_key) group is the winner.
-        if claim.claim_key not in model_winners:
-            model_winners[claim.claim_key] = claim
+    for claim in claims.iterator(chunk_size=CLAIM_CHUNK_SIZE):
+        result.setdefault(claim.object_id, {})[claim.claim_key] = claim
 
     return result
 
@@ -367,8 +383,9 @@ def _apply_resolution(
     extra_data: JsonBody = {}
 
     # Apply winners.
+    relationship_namespaces = get_relationship_namespaces()
     for _claim_key, claim in winners.items():
-        if claim.field_name in get_relationship_namespaces():
+        if claim.field_name in relationship_namespaces:
             continue
         if claim.field_name in claim_fields:
             attr = claim_fields[claim.field_name]
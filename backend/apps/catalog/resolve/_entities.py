@@ -16,9 +16,11 @@ from apps.core.types import JsonBody
 from apps.provenance.models import Claim, ClaimControlledModel
 
 from ._helpers import (
+    CLAIM_CHUNK_SIZE,
     _annotate_priority,
     _coerce,
     _resolve_fk_generic,
+    _winning_claims,
     build_fk_info,
     get_field_defaults,
     get_preserve_fields,
@@ -64,8 +66,12 @@ def _resolve_single(
 
     Mutates *obj* in memory; the caller is responsible for saving.
     """
-    claims = _annotate_priority(obj.claims.all()).order_by(  # type: ignore[misc]
-        "field_name", "-effective_priority", "-created_at"
+    # Only the winner's value is applied; skip the source/user join columns.
+    claims = (
+        _annotate_priority(obj.claims.all())
+        .select_related(None)
+        .only("object_id", "field_name", "value")
+        .order_by("field_name", "-effective_priority", "-created_at")  # type: ignore[misc]
     )
 
     winners: dict[str, Claim] = {}
@@ -140,25 +146,28 @@ def _resolve_bulk(
         object_ids: If provided, only resolve these object IDs. If None,
             resolve all instances.
 
-    Returns the number of objects updated.
+    Returns the number of objects resolved.
     """
     from django.contrib.contenttypes.models import ContentType
 
     ct = ContentType.objects.get_for_model(model_class)
 
-    # 1. Pre-fetch all active claims for this model class.
-    claims_qs = _annotate_priority(Claim.objects.filter(content_type=ct)).order_by(  # type: ignore[misc]
-        "object_id", "field_name", "-effective_priority", "-created_at"
+    # 1. Pre-fetch the winning active claim per (object, field) for this
+    #    model class; losers are filtered out in SQL.  Resolution only reads
+    #    each winner's value, so load just the columns needed to group and
+    #    apply it rather than full claim, source and user rows.
+    claims_qs = (
+        _annotate_priority(Claim.objects.filter(content_type=ct))
+        .select_related(None)
+        .only("object_id", "field_name", "value")
     )
     if object_ids is not None:
         claims_qs = claims_qs.filter(object_id__in=object_ids)
+    claims_qs = _winning_claims(claims_qs, key="field_name").order_by("object_id")
 
-    # Group by object_id, pick winner per field_name.
     claims_by_obj: dict[int, dict[str, Claim]] = {}
-    for claim in claims_qs:
-        obj_winners = claims_by_obj.setdefault(claim.object_id, {})
-        if claim.field_name not in obj_winners:
-            obj_winners[claim.field_name] = claim
+    for claim in claims_qs.iterator(chunk_size=CLAIM_CHUNK_SIZE):
+        claims_by_obj.setdefault(claim.object_id, {})[claim.field_name] = claim
 
     # 2. Load objects.
     objs_qs = model_class.objects.all()  # type: ignore[attr-defined]
@@ -194,8 +203,19 @@ def _resolve_bulk(
     )
     pre_slugs = {obj.pk: obj.slug for obj in all_objs} if has_unique_slug else {}
 
+    # Snapshot written columns (FKs by attname) so unchanged rows can be
+    # skipped at write time.
+    tracked_attnames = [
+        model_class._meta.get_field(attr).attname for attr in direct_fields.values()
+    ]
+    if has_extra_data:
+        tracked_attnames.append("extra_data")
+    pre_values = {
+        obj.pk: [getattr(obj, attname) for attname in tracked_attnames]
+        for obj in all_objs
+    }
+
     # 4. Resolve each object in memory.
-    now = timezone.now()
     for obj in all_objs:
         winners = claims_by_obj.get(obj.pk, {})
 
@@ -231,12 +251,21 @@ def _resolve_bulk(
         if has_extra_data:
             obj.extra_data = extra_data
 
-        obj.updated_at = now
-
     # 4b. Detect unique-field conflicts across resolved objects.
     if has_unique_slug:
         resolve_unique_conflicts(all_objs, "slug", model_class, pre_slugs)
 
+    # 4c. Keep only objects whose resolved values differ from the database,
+    # stamping updated_at on those (auto_now is not triggered by bulk_update).
+    now = timezone.now()
+    changed_objs: list[ClaimControlledModel] = []
+    for obj in all_objs:
+        resolved = [getattr(obj, attname) for attname in tracked_attnames]
+        if resolved == pre_values[obj.pk]:
+            continue
+        obj.updated_at = now
+        changed_objs.append(obj)
+
     # 5. Bulk write.  Cross-field CheckConstraints are enforced by the DB
     # on bulk_update — a violation aborts the whole batch with IntegrityError,
     # which is the desired ingest behaviour (source data is broken, stop).
@@ -246,9 +275,11 @@ def _resolve_bulk(
     update_fields = [*set(direct_fields.values()), "updated_at"]
     if has_extra_data:
         update_fields.append("extra_data")
-    model_class.objects.bulk_update(all_objs, update_fields, batch_size=100)  # type: ignore[attr-defined]
+    model_class.objects.bulk_update(changed_objs, update_fields, batch_size=100)  # type: ignore[attr-defined]
 
-    # Sync markdown backlinks (RecordReference) for bulk-resolved objects.
+    # Sync markdown backlinks (RecordReference) for every resolved object, not
+    # just changed ones: sync_references skips link targets that don't exist
+    # yet, so a later run must pick them up even when the markdown is the same.
     from apps.core.markdown import get_markdown_fields
 
     if get_markdown_fields(model_class):
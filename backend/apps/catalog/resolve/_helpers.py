@@ -19,6 +19,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip when streaming claims for bulk resolution.
+CLAIM_CHUNK_SIZE = 2000
+
 
 def validate_check_constraints(obj: models.Model) -> None:
     """Validate cross-field CheckConstraints before save/bulk_update.
@@ -133,12 +136,10 @@ def _coerce(
     model_class: type[ClaimControlledModel], attr: str, value: object
 ) -> object:
     """Coerce a JSON claim value to the type expected by the model field."""
+    field = model_class._meta.get_field(attr)
     if value is None or value == "":
-        field = model_class._meta.get_field(attr)
         return None if field.null else ""
 
-    field = model_class._meta.get_field(attr)
-
     if isinstance(
         field,
         models.IntegerField
@@ -187,23 +188,36 @@ def _annotate_priority(qs: QuerySet[Claim]) -> QuerySet[Claim]:
     ``# type: ignore[misc]`` — django-stubs validates order_by strings against
     the model's declared fields and cannot see runtime ``.annotate()`` fields.
     """
-    from django.db.models import Case, F, IntegerField, Value, When
+    from apps.provenance.helpers import effective_priority
 
     return (
         qs.filter(is_active=True)
         .exclude(source__is_enabled=False)
         .select_related("source", "user")
-        .annotate(
-            effective_priority=Case(
-                When(source__isnull=False, then=F("source__priority")),
-                When(user__isnull=False, then=F("user__priority")),
-                default=Value(0),
-                output_field=IntegerField(),
-            )
-        )
+        .annotate(effective_priority=effective_priority())
     )
 
 
+def _winning_claims(qs: QuerySet[Claim], key: str = "claim_key") -> QuerySet[Claim]:
+    """Narrow a ``_annotate_priority`` queryset to one winner per claim.
+
+    Ranks claims within each ``(object_id, <key>)`` group by
+    ``effective_priority`` then ``created_at`` and keeps rank 1, so losing
+    claims never leave the database.  Django wraps the window filter in a
+    subquery, which works on both SQLite and PostgreSQL.
+    """
+    from django.db.models import F, Window
+    from django.db.models.functions import RowNumber
+
+    return qs.annotate(
+        claim_rank=Window(
+            expression=RowNumber(),
+            partition_by=[F("object_id"), F(key)],
+            order_by=[F("effective_priority").desc(), F("created_at").desc()],
+        )
+    ).filter(claim_rank=1)
+
+
 # ------------------------------------------------------------------
 # Field defaults
 # ------------------------------------------------------------------
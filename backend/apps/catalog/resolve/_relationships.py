@@ -48,7 +48,7 @@ from ._claim_values import (
     LocationClaimValue,
     ParentClaimValue,
 )
-from ._helpers import _annotate_priority
+from ._helpers import CLAIM_CHUNK_SIZE, _annotate_priority, _winning_claims
 
 logger = logging.getLogger(__name__)
 
@@ -114,28 +114,28 @@ def _resolve_machine_model_m2m(
     )
     if subject_ids is not None:
         claims_qs = claims_qs.filter(object_id__in=subject_ids)
-    claims = claims_qs.order_by(  # type: ignore[misc]
-        "object_id", "claim_key", "-effective_priority", "-created_at"
+    # Winners per (object_id, claim_key) are picked in SQL; only their
+    # values are read.
+    claims = (
+        _winning_claims(claims_qs)
+        .order_by("object_id")
+        .values_list("object_id", "value")
     )
 
-    # Pick winner per (object_id, claim_key).
-    winners_by_model: dict[int, list[Claim]] = {}
-    seen: set[ClaimDedupKey] = set()
-    for claim in claims:
-        key = ClaimDedupKey(claim.object_id, claim.claim_key)
-        if key not in seen:
-            seen.add(key)
-            winners_by_model.setdefault(claim.object_id, []).append(claim)
+    winners_by_model: dict[int, list[Mapping[str, object]]] = {}
+    for object_id, value in claims.iterator(chunk_size=CLAIM_CHUNK_SIZE):
+        winners_by_model.setdefault(object_id, []).append(
+            cast(Mapping[str, object], value)
+        )
 
     # Valid PKs for existence check against stale claims.
     valid_pks = set(spec.target_model._default_manager.values_list("pk", flat=True))
 
     # Desired PKs from winning claims.
     desired_by_model: dict[int, set[int]] = {}
-    for model_id, claims_list in winners_by_model.items():
+    for model_id, values in winners_by_model.items():
         desired: set[int] = set()
-        for claim in claims_list:
-            val = cast(Mapping[str, object], claim.value)
+        for val in values:
             if not val.get("exists", True):
                 continue
             target_pk = val.get(spec.field_name)
@@ -150,44 +150,43 @@ def _resolve_machine_model_m2m(
             desired.add(target_pk)
         desired_by_model[model_id] = desired
 
-    # Pre-fetch existing M2M through-table rows.
-    if subject_ids is not None:
-        all_model_ids = subject_ids
-    else:
-        all_model_ids = set(MachineModel.objects.values_list("pk", flat=True))
+    # Pre-fetch existing M2M through-table rows.  A full resolve reads the
+    # whole through table rather than shipping every model pk in an IN list.
     through: type[Model] = getattr(MachineModel, spec.m2m_attr).through
     target_model_name = spec.target_model._meta.model_name
     assert target_model_name is not None
     target_col = target_model_name + "_id"
+    if subject_ids is not None:
+        all_model_ids = subject_ids
+        existing_qs = through._default_manager.filter(machinemodel_id__in=subject_ids)
+    else:
+        all_model_ids = set(
+            MachineModel.objects.order_by().values_list("pk", flat=True)
+        )
+        existing_qs = through._default_manager.all()
 
+    # One pass over existing rows: record what's there and mark rows no
+    # longer backed by a winning claim for deletion.
     existing_by_model: dict[int, set[int]] = {}
-    for row in through._default_manager.filter(
-        machinemodel_id__in=all_model_ids
-    ).values_list("machinemodel_id", target_col):
-        existing_by_model.setdefault(row[0], set()).add(row[1])
-
-    # Diff and apply.
-    to_create = []
     to_delete_pks: list[int] = []
+    for pk, model_id, fk_id in existing_qs.values_list(
+        "pk", "machinemodel_id", target_col
+    ):
+        existing_by_model.setdefault(model_id, set()).add(fk_id)
+        if fk_id not in desired_by_model.get(model_id, ()):
+            to_delete_pks.append(pk)
 
-    for model_id in all_model_ids:
-        desired = desired_by_model.get(model_id, set())
-        existing = existing_by_model.get(model_id, set())
-
-        for target_pk in desired - existing:
+    # Diff and apply.  Only models with winning claims can need new rows;
+    # skip claims whose subject no longer exists.
+    to_create = []
+    for model_id, desired in desired_by_model.items():
+        if model_id not in all_model_ids:
+            continue
+        for target_pk in desired - existing_by_model.get(model_id, set()):
             to_create.append(
                 through(machinemodel_id=model_id, **{target_col: target_pk})
             )
 
-    # Build a lookup for deletions.
-    for row in through._default_manager.filter(
-        machinemodel_id__in=all_model_ids
-    ).values_list("pk", "machinemodel_id", target_col):
-        pk, model_id, fk_id = row
-        desired = desired_by_model.get(model_id, set())
-        if fk_id not in desired:
-            to_delete_pks.append(pk)
-
     if to_delete_pks:
         through._default_manager.filter(pk__in=to_delete_pks).delete()
     if to_create:
@@ -225,28 +224,28 @@ def resolve_all_gameplay_features(
     )
     if subject_ids is not None:
         claims_qs = claims_qs.filter(object_id__in=subject_ids)
-    claims = claims_qs.order_by(  # type: ignore[misc]
-        "object_id", "claim_key", "-effective_priority", "-created_at"
+    # Winners per (object_id, claim_key) are picked in SQL; only their
+    # values are read.
+    claims = (
+        _winning_claims(claims_qs)
+        .order_by("object_id")
+        .values_list("object_id", "value")
     )
 
-    # Pick winner per (object_id, claim_key).
-    winners_by_model: dict[int, list[Claim]] = {}
-    seen: set[ClaimDedupKey] = set()
-    for claim in claims:
-        key = ClaimDedupKey(claim.object_id, claim.claim_key)
-        if key not in seen:
-            seen.add(key)
-            winners_by_model.setdefault(claim.object_id, []).append(claim)
+    winners_by_model: dict[int, list[GameplayFeatureClaimValue]] = {}
+    for object_id, value in claims.iterator(chunk_size=CLAIM_CHUNK_SIZE):
+        winners_by_model.setdefault(object_id, []).append(
+            cast(GameplayFeatureClaimValue, value)
+        )
 
     # Valid PKs for existence check against stale claims.
-    valid_pks = set(GameplayFeature.objects.values_list("pk", flat=True))
+    valid_pks = set(GameplayFeature.objects.order_by().values_list("pk", flat=True))
 
     # Desired (feature_pk, count) from winning claims.
     desired_by_model: dict[int, dict[int, int | None]] = {}
-    for mid, claims_list in winners_by_model.items():
+    for mid, values in winners_by_model.items():
         desired: dict[int, int | None] = {}
-        for claim in claims_list:
-            val = cast(GameplayFeatureClaimValue, claim.value)
+        for val in values:
             if not val.get("exists", True):
                 continue
             feature_pk = val.get("gameplay_feature")
@@ -260,15 +259,22 @@ def resolve_all_gameplay_features(
             desired[feature_pk] = val.get("count")
         desired_by_model[mid] = desired
 
-    # Pre-fetch existing through-table rows.
+    # Pre-fetch existing through-table rows.  A full resolve reads the
+    # whole table rather than shipping every model pk in an IN list.
     if subject_ids is not None:
         all_model_ids = subject_ids
+        existing_qs = MachineModelGameplayFeature.objects.filter(
+            machinemodel_id__in=subject_ids
+        )
     else:
-        all_model_ids = set(MachineModel.objects.values_list("pk", flat=True))
+        all_model_ids = set(
+            MachineModel.objects.order_by().values_list("pk", flat=True)
+        )
+        existing_qs = MachineModelGameplayFeature.objects.all()
     existing_by_model: dict[int, dict[int, tuple[int, int | None]]] = {}
-    for row in MachineModelGameplayFeature.objects.filter(
-        machinemodel_id__in=all_model_ids
-    ).values_list("pk", "machinemodel_id", "gameplayfeature_id", "count"):
+    for row in existing_qs.order_by().values_list(
+        "pk", "machinemodel_id", "gameplayfeature_id", "count"
+    ):
         pk, mid, fk_id, count = row
         existing_by_model.setdefault(mid, {})[fk_id] = (pk, count)
 
@@ -341,8 +347,7 @@ def resolve_all_credits(
 
     ct = ContentType.objects.get_for_model(MachineModel)
 
-    valid_person_pks = set(Person.objects.values_list("pk", flat=True))
-    valid_role_pks = set(CreditRole.objects.values_list("pk", flat=True))
+    valid_role_pks = set(CreditRole.objects.order_by().values_list("pk", flat=True))
     if not valid_role_pks:
         logger.warning(
             "CreditRole table is empty — skipping bulk credit resolution. "
@@ -355,23 +360,36 @@ def resolve_all_credits(
     )
     if subject_ids is not None:
         credit_qs = credit_qs.filter(object_id__in=subject_ids)
-    credit_claims = credit_qs.order_by(  # type: ignore[misc]
-        "object_id", "claim_key", "-effective_priority", "-created_at"
+    # Only the winning claim values are read, so skip building Claim
+    # instances (and their joined source/user) for every row.
+    credit_claims = (
+        _winning_claims(credit_qs)
+        .order_by("object_id")
+        .values_list("object_id", "value")
     )
 
-    winners_by_model: dict[int, list[Claim]] = {}
-    seen: set[ClaimDedupKey] = set()
-    for claim in credit_claims:
-        key = ClaimDedupKey(claim.object_id, claim.claim_key)
-        if key not in seen:
-            seen.add(key)
-            winners_by_model.setdefault(claim.object_id, []).append(claim)
+    winners_by_model: dict[int, list[CreditClaimValue]] = {}
+    for object_id, value in credit_claims.iterator(chunk_size=CLAIM_CHUNK_SIZE):
+        winners_by_model.setdefault(object_id, []).append(cast(CreditClaimValue, value))
+
+    # Validate only the people the winning claims reference, rather than
+    # loading every Person pk when resolving a handful of models.
+    referenced_person_pks = {
+        person_pk
+        for values in winners_by_model.values()
+        for val in values
+        if isinstance(person_pk := val.get("person"), int)
+    }
+    valid_person_pks = set(
+        Person.objects.filter(pk__in=referenced_person_pks)
+        .order_by()
+        .values_list("pk", flat=True)
+    )
 
     desired_by_model: dict[int, set[CreditAssignment]] = {}
-    for model_id, claims_list in winners_by_model.items():
+    for model_id, values in winners_by_model.items():
         desired: set[CreditAssignment] = set()
-        for claim in claims_list:
-            val = cast(CreditClaimValue, claim.value)
+        for val in values:
             if not val.get("exists", True):
                 continue
             person_pk = val.get("person")
@@ -393,27 +411,36 @@ def resolve_all_credits(
             desired.add(CreditAssignment(person_pk, role_pk))
         desired_by_model[model_id] = desired
 
+    # Credit's Meta.ordering joins role and person; the diff doesn't need
+    # an order, so clear it to keep the read single-table.
     if subject_ids is not None:
         all_model_ids = subject_ids
+        dc_qs = Credit.objects.filter(model_id__in=subject_ids).order_by()
     else:
-        all_model_ids = set(MachineModel.objects.values_list("pk", flat=True))
-    existing_by_model: dict[int, set[CreditAssignment]] = {}
-    dc_qs = Credit.objects.filter(model_id__in=all_model_ids)
-    for model_id, person_id, role_id in dc_qs.values_list(
-        "model_id", "person_id", "role_id"
-    ):
-        existing_by_model.setdefault(model_id, set()).add(
-            CreditAssignment(person_id, role_id)
+        all_model_ids = set(
+            MachineModel.objects.order_by().values_list("pk", flat=True)
         )
+        dc_qs = Credit.objects.filter(model__isnull=False).order_by()
 
-    to_create: list[Credit] = []
+    # One pass over existing rows: record what's there and mark rows no
+    # longer backed by a winning claim for deletion.
+    existing_by_model: dict[int, set[CreditAssignment]] = {}
     to_delete_pks: list[int] = []
+    for pk, model_id, person_id, role_id in dc_qs.values_list(
+        "pk", "model_id", "person_id", "role_id"
+    ):
+        assignment = CreditAssignment(person_id, role_id)
+        existing_by_model.setdefault(model_id, set()).add(assignment)
+        if assignment not in desired_by_model.get(model_id, ()):
+            to_delete_pks.append(pk)
 
-    for model_id in all_model_ids:
-        desired = desired_by_model.get(model_id, set())
-        existing = existing_by_model.get(model_id, set())
-
-        for assignment in desired - existing:
+    # Only models with winning claims can need new rows; skip claims whose
+    # subject no longer exists.
+    to_create: list[Credit] = []
+    for model_id, desired in desired_by_model.items():
+        if model_id not in all_model_ids:
+            continue
+        for assignment in desired - existing_by_model.get(model_id, set()):
             to_create.append(
                 Credit(
                     model_id=model_id,
@@ -422,13 +449,6 @@ def resolve_all_credits(
                 )
             )
 
-    for pk, model_id, person_id, role_id in Credit.objects.filter(
-        model_id__in=all_model_ids
-    ).values_list("pk", "model_id", "person_id", "role_id"):
-        desired = desired_by_model.get(model_id, set())
-        if CreditAssignment(person_id, role_id) not in desired:
-            to_delete_pks.append(pk)
-
     if to_delete_pks:
         Credit.objects.filter(pk__in=to_delete_pks).delete()
     if to_create:
@@ -479,7 +499,7 @@ def resolve_all_title_abbreviations(
     all_title_ids = (
         subject_ids
         if subject_ids is not None
-        else set(Title.objects.values_list("pk", flat=True))
+        else set(Title.objects.order_by().values_list("pk", flat=True))
     )
     existing_by_title: dict[int, set[str]] = {}
     for title_id, value in TitleAbbreviation.objects.filter(
@@ -576,7 +596,9 @@ def resolve_all_model_abbreviations(
     if subject_ids is not None:
         all_model_ids = subject_ids
     else:
-        all_model_ids = set(MachineModel.objects.values_list("pk", flat=True))
+        all_model_ids = set(
+            MachineModel.objects.order_by().values_list("pk", flat=True)
+        )
     title_abbrs_by_model = _get_title_abbrs_for_models(all_model_ids)
     for model_id in list(desired_by_model):
         title_abbrs = title_abbrs_by_model.get(model_id, set())
@@ -821,7 +843,7 @@ def _resolve_parents(
             seen.add(key)
             winners_by_child.setdefault(claim.object_id, []).append(claim)
 
-    valid_pks = set(parent_model.objects.values_list("pk", flat=True))  # type: ignore[attr-defined]
+    valid_pks = set(parent_model.objects.order_by().values_list("pk", flat=True))  # type: ignore[attr-defined]
 
     desired_by_child: dict[int, set[int]] = {}
     for child_id, claims_list in winners_by_child.items():
@@ -847,7 +869,7 @@ def _resolve_parents(
     from_col = f"from_{model_name}_id"
     to_col = f"to_{model_name}_id"
 
-    all_child_ids = set(parent_model.objects.values_list("pk", flat=True))  # type: ignore[attr-defined]
+    all_child_ids = set(parent_model.objects.order_by().values_list("pk", flat=True))  # type: ignore[attr-defined]
     existing_by_child: dict[int, set[int]] = {}
     for row in through._default_manager.filter(
         **{f"{from_col}__in": all_child_ids}
@@ -919,7 +941,7 @@ def resolve_all_corporate_entity_locations(
     from django.contrib.contenttypes.models import ContentType
 
     ce_ct = ContentType.objects.get_for_model(CorporateEntity)
-    valid_loc_pks = set(Location.objects.values_list("pk", flat=True))
+    valid_loc_pks = set(Location.objects.order_by().values_list("pk", flat=True))
 
     claims_qs = Claim.objects.filter(
         content_type=ce_ct, field_name="location", is_active=True
@@ -1,5 +1,7 @@
 """Tests for the ingest_wikidata command and wikidata_sparql module."""
 
+from io import StringIO
+
 import pytest
 from django.core.management import call_command
 
@@ -190,6 +192,72 @@ class TestIngestWikidata:
         assert Credit.objects.filter(person__name="Pat Designer").count() == 0
 
 
+@pytest.mark.django_db
+class TestNonAsciiMachineMatch:
+    def test_credit_matches_non_ascii_machine_name(self, credit_roles, tmp_path):
+        import json
+
+        person = Person.objects.create(name="Steve Ritchie", slug="steve-ritchie")
+        machine = make_machine_model(name="Über Zone", slug="uber-zone")
+        person_uri = {"type": "uri", "value": "http://www.wikidata.org/entity/Q1"}
+        data = {
+            "persons": {
+                "results": {
+                    "bindings": [
+                        {
+                            "person": person_uri,
+                            "personLabel": {
+                                "type": "literal",
+                                "value": "Steve Ritchie",
+                            },
+                        }
+                    ]
+                }
+            },
+            "bio": {"results": {"bindings": []}},
+            "credits": {
+                "results": {
+                    "bindings": [
+                        {
+                            "work": {
+                                "type": "uri",
+                                "value": "http://www.wikidata.org/entity/Q2",
+                            },
+                            "workLabel": {"type": "literal", "value": "ÜBER ZONE"},
+                            "person": person_uri,
+                            "prop": {"type": "literal", "value": "P287"},
+                        }
+                    ]
+                }
+            },
+        }
+        path = tmp_path / "dump.json"
+        path.write_text(json.dumps(data))
+
+        call_command("ingest_wikidata", from_dump=str(path))
+
+        assert Credit.objects.filter(
+            person=person, model=machine, role__slug="design"
+        ).exists()
+
+
+@pytest.mark.django_db
+class TestMatchConfidence:
+    def test_confidence_reflects_existing_credits(self, _seed_db):
+        out = StringIO()
+        call_command("ingest_wikidata", from_dump=SAMPLE, stdout=out, verbosity=2)
+        report = out.getvalue()
+        assert "[MATCH 0.95] Steve Ritchie" in report
+        assert "[MATCH 0.85] Pat Designer" in report
+
+    def test_match_report_hidden_by_default(self, _seed_db):
+        out = StringIO()
+        call_command("ingest_wikidata", from_dump=SAMPLE, stdout=out)
+        report = out.getvalue()
+        assert "[MATCH" not in report
+        assert "Matched: 2" in report
+
+
 @pytest.mark.django_db
 class TestFromDumpEmpty:
     """Empty dump should not crash and should still create the source."""
@@ -190,6 +190,22 @@ class TestResolveAll:
         assert pm2.updated_at >= before
         assert pm3.updated_at >= before
 
+    def test_unchanged_models_are_not_rewritten(self):
+        ipdb = Source.objects.create(
+            name="IPDB", slug="ipdb", source_type="database", priority=10
+        )
+        pm = make_machine_model(name="P1", slug="p1")
+        Claim.objects.assert_claim(pm, "name", "Medieval Madness", source=ipdb)
+
+        resolve_machine_models()
+        pm.refresh_from_db()
+        first_updated_at = pm.updated_at
+
+        resolve_machine_models()
+        pm.refresh_from_db()
+        assert pm.name == "Medieval Madness"
+        assert pm.updated_at == first_updated_at
+
     def test_matches_resolve_model(self):
         ipdb = Source.objects.create(
             name="IPDB", slug="ipdb", source_type="database", priority=10
@@ -233,6 +249,24 @@ class TestResolveAll:
         assert pm_bulk.technology_generation_id == pm_single.technology_generation_id
         assert pm_bulk.extra_data == pm_single.extra_data
 
+    def test_higher_priority_wins_per_field(self):
+        ipdb = Source.objects.create(
+            name="IPDB", slug="ipdb", source_type="database", priority=10
+        )
+        opdb = Source.objects.create(
+            name="OPDB", slug="opdb", source_type="database", priority=20
+        )
+        pm = make_machine_model(name="Alpha", slug="alpha")
+        Claim.objects.assert_claim(pm, "year", 1997, source=opdb)
+        Claim.objects.assert_claim(pm, "year", 1998, source=ipdb)
+        Claim.objects.assert_claim(pm, "player_count", 4, source=ipdb)
+
+        resolve_machine_models()
+        pm.refresh_from_db()
+
+        assert pm.year == 1997
+        assert pm.player_count == 4
+
     def test_opdb_conflict(self):
         ipdb = Source.objects.create(
             name="IPDB", slug="ipdb", source_type="database", priority=10
@@ -158,6 +158,19 @@ class TestResolveBulkTitle:
         t.refresh_from_db()
         assert t.updated_at > old_updated_at
 
+    def test_unchanged_objects_are_not_rewritten(self, opdb):
+        t = Title.objects.create(opdb_id="G1", name="Placeholder", slug="t1")
+        Claim.objects.assert_claim(t, "name", "New Name", source=opdb)
+        _resolve_bulk(Title, get_claim_fields(Title))
+        t.refresh_from_db()
+        first_updated_at = t.updated_at
+
+        _resolve_bulk(Title, get_claim_fields(Title))
+
+        t.refresh_from_db()
+        assert t.name == "New Name"
+        assert t.updated_at == first_updated_at
+
 
 @pytest.mark.django_db
 class TestResolveBulkManufacturer:
@@ -208,6 +221,24 @@ class TestResolveBulkMarkdownReferences:
         assert ref.target_type == system_ct
         assert ref.target_id == system.pk
 
+    def test_bulk_resolve_picks_up_late_link_targets(self, opdb):
+        """Unchanged markdown still gains references to targets created later."""
+        mfr = Manufacturer.objects.create(name="Williams", slug="williams")
+        Claim.objects.assert_claim(mfr, "name", "Williams", source=opdb)
+        Claim.objects.assert_claim(
+            mfr, "description", "Uses [[system:id:9999]].", source=opdb
+        )
+        _resolve_bulk(Manufacturer, get_claim_fields(Manufacturer))
+
+        mfr_ct = ContentType.objects.get_for_model(Manufacturer)
+        refs = RecordReference.objects.filter(source_type=mfr_ct, source_id=mfr.pk)
+        assert refs.count() == 0
+
+        System.objects.create(pk=9999, name="WPC-95", slug="wpc-95", manufacturer=mfr)
+        _resolve_bulk(Manufacturer, get_claim_fields(Manufacturer))
+
+        assert refs.count() == 1
+
     def test_bulk_resolve_cleans_stale_references(self, opdb):
         """_resolve_bulk removes RecordReference when markdown links are removed."""
         mfr = Manufacturer.objects.create(name="Williams", slug="williams")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from typing import ClassVar, Self, TypeVar
 
 from django.core.exceptions import ImproperlyConfigured
@@ -45,13 +46,22 @@ def unique_slug(obj: models.Model, source: str, fallback: str = "item") -> str:
     """Generate a unique slug with counter disambiguation.
 
     Appends a counter suffix (-2, -3, …) until the slug is unique within
-    the model's table.
+    the model's table. Candidate slugs are fetched in one query and the
+    counter is resolved in-process, so crowded bases don't cost a round
+    trip per probe. Only numeric suffixes are fetched, so unrelated
+    ``{base}-…`` slugs don't inflate the result.
     """
     base = slugify(source) or fallback
+    manager = type(obj)._default_manager
+    candidates = models.Q(slug=base) | models.Q(
+        slug__regex=rf"^{re.escape(base)}-[0-9]+$"
+    )
+    taken = set(
+        manager.filter(candidates).exclude(pk=obj.pk).values_list("slug", flat=True)
+    )
     slug = base
     counter = 2
-    manager = type(obj)._default_manager
-    while manager.filter(slug=slug).exclude(pk=obj.pk).exists():
+    while slug in taken:
         slug = f"{base}-{counter}"
         counter += 1
     return slug
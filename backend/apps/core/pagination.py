@@ -21,13 +21,18 @@ This module fixes both:
 The patch is opt-in (only triggers when ``response_name`` is set), so any
 paginator that doesn't define ``response_name`` keeps Ninja's default
 behavior.
+
+``SerializedPage`` lets a paginated view hand Ninja a queryset plus a
+batch serializer, so only the requested page is fetched and serialized.
 """
 
 from __future__ import annotations
 
-from typing import Any, ClassVar
+from collections.abc import Callable, Sequence
+from typing import Any, ClassVar, TypeVar, overload
 
 import ninja.pagination as _ninja_pagination
+from django.db.models import QuerySet
 from ninja import Field, Schema
 from ninja.operation import Operation
 from ninja.pagination import PageNumberPagination, PaginationBase
@@ -48,6 +53,44 @@ class NamedPageNumberPagination(PageNumberPagination):
     response_name: ClassVar[str | None] = None
 
 
+_R = TypeVar("_R")
+_S = TypeVar("_S")
+
+
+class SerializedPage(Sequence[_S]):
+    """A queryset that serializes rows only when the paginator slices it.
+
+    Ninja's ``PageNumberPagination`` slices whatever the view returns and
+    counts it with ``len()``. Returning a fully serialized list therefore
+    loads and serializes every matching row for each page request. Wrapping
+    the queryset defers both: ``len()`` becomes ``COUNT(*)`` and a slice
+    fetches just that page before passing the rows to *serialize* as one
+    batch (so serializers can bulk-load per-page data).
+    """
+
+    def __init__(
+        self,
+        queryset: QuerySet[Any, _R],
+        serialize: Callable[[list[_R]], list[_S]],
+    ) -> None:
+        self._queryset = queryset
+        self._serialize = serialize
+
+    def __len__(self) -> int:
+        return self._queryset.count()
+
+    @overload
+    def __getitem__(self, index: int) -> _S: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[_S]: ...
+
+    def __getitem__(self, index: int | slice) -> _S | list[_S]:
+        if isinstance(index, slice):
+            return self._serialize(list(self._queryset[index]))
+        return self._serialize([self._queryset[index]])[0]
+
+
 _orig_make_response_paginated = _ninja_pagination.make_response_paginated
 
 
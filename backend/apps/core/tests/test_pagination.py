@@ -0,0 +1,42 @@
+"""Tests for ``SerializedPage``, the lazy paginated-view helper."""
+
+from __future__ import annotations
+
+import pytest
+
+from apps.core.models import License
+from apps.core.pagination import SerializedPage
+
+
+@pytest.fixture
+def licenses():
+    return [
+        License.objects.create(name=f"License {i}", short_name=f"L{i}")
+        for i in range(5)
+    ]
+
+
+@pytest.mark.django_db
+class TestSerializedPage:
+    def test_len_counts_queryset(self, licenses):
+        page = SerializedPage(License.objects.all(), lambda rows: rows)
+        assert len(page) == 5
+
+    def test_slice_serializes_only_that_page(self, licenses):
+        batches: list[list[str]] = []
+
+        def serialize(rows: list[License]) -> list[str]:
+            names = [lic.short_name for lic in rows]
+            batches.append(names)
+            return names
+
+        page = SerializedPage(License.objects.order_by("short_name"), serialize)
+        assert page[1:3] == ["L1", "L2"]
+        assert batches == [["L1", "L2"]]
+
+    def test_index_returns_single_item(self, licenses):
+        page = SerializedPage(
+            License.objects.order_by("short_name"),
+            lambda rows: [lic.short_name for lic in rows],
+        )
+        assert page[0] == "L0"
@@ -0,0 +1,35 @@
+"""Tests for the ``unique_slug()`` counter disambiguation."""
+
+import pytest
+
+from apps.provenance.models import Source
+
+
+@pytest.mark.django_db
+class TestUniqueSlug:
+    def test_slug_derived_from_source(self):
+        source = Source.objects.create(name="Pinside", source_type="database")
+        assert source.slug == "pinside"
+
+    def test_falls_back_when_source_slugifies_empty(self):
+        source = Source.objects.create(name="!!!", source_type="database")
+        assert source.slug == "source"
+
+    def test_collision_takes_next_free_counter(self):
+        Source.objects.create(name="IPDB", source_type="database")
+        Source.objects.create(name="IPDB-2", source_type="database")
+        Source.objects.create(name="IPDB Archive", source_type="database")
+        source = Source.objects.create(name="IPDB!", source_type="database")
+        assert source.slug == "ipdb-3"
+
+    def test_non_numeric_suffixes_do_not_collide(self):
+        Source.objects.create(name="IPDB Archive", source_type="database")
+        Source.objects.create(name="IPDB 2023 Mirror", source_type="database")
+        source = Source.objects.create(name="IPDB", source_type="database")
+        assert source.slug == "ipdb"
+
+    def test_resave_keeps_own_slug(self):
+        source = Source.objects.create(name="IPDB", source_type="database")
+        source.slug = ""
+        source.save()
+        assert source.slug == "ipdb"
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from django.db.models import Model
+from django.db.models import Model, QuerySet
 from django.http import HttpRequest
 
 from .models import (
@@ -56,6 +56,7 @@ class IngestRunAdmin(ReadOnlyAdminMixin, admin.ModelAdmin[IngestRun]):
     """Read-only inspection view. IngestRun records are created by the apply layer."""
 
     list_display = ("pk", "source", "status", "started_at", "finished_at")
+    list_select_related = ("source",)
     list_filter = ("source", "status")
     readonly_fields = (
         "source",
@@ -77,6 +78,7 @@ class IngestRunAdmin(ReadOnlyAdminMixin, admin.ModelAdmin[IngestRun]):
 @admin.register(ChangeSet)
 class ChangeSetAdmin(admin.ModelAdmin[ChangeSet]):
     list_display = ("pk", "user", "note_truncated", "created_at")
+    list_select_related = ("user",)
     list_filter = ("user",)
     readonly_fields = ("created_at",)
 
@@ -99,10 +101,16 @@ class ClaimAdmin(ReadOnlyAdminMixin, admin.ModelAdmin[Claim]):
         "is_active",
         "created_at",
     )
+    list_select_related = ("source",)
     list_filter = ("source", "is_active", "field_name")
     search_fields = ("field_name",)
     readonly_fields = ("content_type", "object_id", "changeset", "created_at")
 
+    def get_queryset(self, request: HttpRequest) -> QuerySet[Claim]:
+        # ``subject`` is a GenericForeignKey: prefetching batches the lookup
+        # per content type instead of one query per row.
+        return super().get_queryset(request).prefetch_related("subject")
+
     @admin.display(description="Value")
     def value_truncated(self, obj: Claim) -> str:
         s = str(obj.value)
@@ -10,7 +10,8 @@ import re
 
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
-from django.db.models import Q
+from django.db.models import Q, Value
+from django.db.models.functions import Lower
 from django.http import HttpRequest
 from django.shortcuts import get_object_or_404
 from django.views.decorators.cache import cache_control
@@ -89,7 +90,11 @@ def _build_claim_review_context(
     # Related OPDB-backed titles by name match.
     base_name = re.sub(r"\s*\([^)]*\)\s*$", "", title.name).strip()
     related = (
-        Title.objects.filter(Q(name__iexact=title.name) | Q(name__iexact=base_name))
+        Title.objects.annotate(lower_name=Lower("name"))
+        .filter(
+            Q(lower_name=Lower(Value(title.name)))
+            | Q(lower_name=Lower(Value(base_name)))
+        )
         .exclude(pk=title.pk)
         .exclude(opdb_id__isnull=True)
     )
@@ -6,7 +6,8 @@ from collections.abc import Iterable
 from typing import cast
 
 from django.db import models
-from django.db.models import Case, F, IntegerField, Prefetch, QuerySet, Value, When
+from django.db.models import F, IntegerField, Prefetch, QuerySet, Value
+from django.db.models.functions import Coalesce
 
 from .display import FieldValue, claim_value, resolve_labels
 from .models import ChangeSet, CitationInstance, Claim
@@ -35,6 +36,21 @@ def changeset_author(cs: ChangeSet) -> ClaimAuthorSchema:
     return ClaimSourceAuthorSchema(name=cs.ingest_run.source.name)
 
 
+def effective_priority() -> Coalesce:
+    """Return the ``effective_priority`` expression for Claim querysets.
+
+    A claim has exactly one of ``source`` or ``user`` (DB CHECK), and both
+    priority columns are NOT NULL, so the first non-null priority is the
+    claim's author priority.  Falls back to 0 to match the resolver.
+    """
+    return Coalesce(
+        F("source__priority"),
+        F("user__priority"),
+        Value(0),
+        output_field=IntegerField(),
+    )
+
+
 def claims_prefetch(
     to_attr: str = "active_claims",
 ) -> Prefetch[str, QuerySet[Claim], str]:
@@ -53,14 +69,7 @@ def claims_prefetch(
                 to_attr="prefetched_citation_instances",
             )
         )
-        .annotate(
-            effective_priority=Case(
-                When(source__isnull=False, then=F("source__priority")),
-                When(user__isnull=False, then=F("user__priority")),
-                default=Value(0),
-                output_field=IntegerField(),
-            )
-        )
+        .annotate(effective_priority=effective_priority())
         .order_by("claim_key", "-effective_priority", "-created_at"),
         to_attr=to_attr,
     )
@@ -7,12 +7,12 @@ from collections.abc import Iterable, Mapping, Sequence
 from itertools import chain
 
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Case, F, IntegerField, Model, Prefetch, Q, Value, When
+from django.db.models import Model, Prefetch, Q
 
 from apps.core.authz import PolicyUser, compute_row_capabilities
 
 from .display import FieldValue, LabelLookup, claim_value, resolve_labels
-from .helpers import changeset_author
+from .helpers import changeset_author, effective_priority
 from .models import ChangeSet, Claim
 from .schemas import (
     ChangeSetSchema,
@@ -115,14 +115,7 @@ def _compute_winning_claim_ids(ct: ContentType, entity_pk: int) -> set[int]:
             is_active=True,
         )
         .exclude(source__is_enabled=False)
-        .annotate(
-            effective_priority=Case(
-                When(source__isnull=False, then=F("source__priority")),
-                When(user__isnull=False, then=F("user__priority")),
-                default=Value(0),
-                output_field=IntegerField(),
-            )
-        )
+        .annotate(effective_priority=effective_priority())
         .order_by("claim_key", "-effective_priority", "-created_at", "-pk")
     )
 
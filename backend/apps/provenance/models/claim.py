@@ -215,31 +215,43 @@ class ClaimManager(models.Manager["Claim"]):
         deduped = list(seen.values())
         duplicates_removed = len(pending_claims) - len(deduped)
 
-        # 2. Fetch existing active claims from this source.
+        # 2. Fetch existing active claims from this source for the pending
+        #    subjects only — a source's claims on other entities (or other
+        #    content types) can never match a pending key.
         # Use values_list to avoid full ORM object instantiation — on large
         # sources (40-50k+ claims) the overhead of JSONField deserialization
         # on full Claim objects causes multi-minute stalls on SQLite.
+        pending_subjects: dict[int, set[int]] = {}
+        for c in deduped:
+            pending_subjects.setdefault(c.content_type_id, set()).add(c.object_id)
+
         existing: dict[ClaimIdentity, ExistingClaimRow] = {}
-        for row in self.filter(source=source, is_active=True).values_list(
-            "pk",
-            "content_type_id",
-            "object_id",
-            "claim_key",
-            "value",
-            "citation",
-            "needs_review",
-            "needs_review_notes",
-            "license_id",
-        ):
-            pk, ct_id, obj_id, ck, val, cit, nr, nrn, lic_id = row
-            existing[ClaimIdentity(ct_id, obj_id, ck)] = ExistingClaimRow(
-                value=val,
-                citation=cit,
-                needs_review=nr,
-                needs_review_notes=nrn,
-                license_id=lic_id,
-                pk=pk,
-            )
+        for subject_ct_id, subject_ids in pending_subjects.items():
+            for row in self.filter(
+                source=source,
+                is_active=True,
+                content_type_id=subject_ct_id,
+                object_id__in=subject_ids,
+            ).values_list(
+                "pk",
+                "content_type_id",
+                "object_id",
+                "claim_key",
+                "value",
+                "citation",
+                "needs_review",
+                "needs_review_notes",
+                "license_id",
+            ):
+                pk, ct_id, obj_id, ck, val, cit, nr, nrn, lic_id = row
+                existing[ClaimIdentity(ct_id, obj_id, ck)] = ExistingClaimRow(
+                    value=val,
+                    citation=cit,
+                    needs_review=nr,
+                    needs_review_notes=nrn,
+                    license_id=lic_id,
+                    pk=pk,
+                )
 
         # 3. Diff: skip unchanged, collect superseded + new.
         to_deactivate_ids: list[int] = []
@@ -276,9 +288,7 @@ class ClaimManager(models.Manager["Claim"]):
                 for ct_id, obj_id in authoritative_scope:
                     parent_groups.setdefault(ct_id, set()).add(obj_id)
             else:
-                parent_groups = {}
-                for c in deduped:
-                    parent_groups.setdefault(c.content_type_id, set()).add(c.object_id)
+                parent_groups = pending_subjects
 
             stale_ids: list[int] = []
             for ct_id, obj_ids in parent_groups.items():
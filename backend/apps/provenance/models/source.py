@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, ClassVar
 
 from django.db import models
 
@@ -20,6 +20,27 @@ from apps.core.models import (
 SOURCE_DESCRIPTION_MAX_LENGTH = 2_000
 
 
+class SourceManager(models.Manager["Source"]):
+    def ensure(self, slug: str, defaults: dict[str, object]) -> Source:
+        """Get or create the source by slug, writing only fields that differ.
+
+        Ingest commands call this on every run. Unlike ``update_or_create``,
+        an unchanged source costs a single SELECT — no UPDATE, no
+        ``updated_at`` bump, no post_save signal.
+        """
+        source, created = self.get_or_create(slug=slug, defaults=defaults)
+        if created:
+            return source
+        changed = [
+            name for name, value in defaults.items() if getattr(source, name) != value
+        ]
+        if changed:
+            for name in changed:
+                setattr(source, name, defaults[name])
+            source.save(update_fields=[*changed, "updated_at"])
+        return source
+
+
 class Source(SluggedModel, TimeStampedModel):
     """A data origin point (external database, book, editorial team, etc.)."""
 
@@ -53,6 +74,8 @@ class Source(SluggedModel, TimeStampedModel):
         help_text="Default license for claims from this source.",
     )
 
+    objects: ClassVar[SourceManager] = SourceManager()
+
     class Meta:
         ordering = ["-priority", "name"]
         constraints = [
@@ -0,0 +1,41 @@
+"""Tests for the Source model manager."""
+
+import pytest
+
+from apps.provenance.models import Source
+
+DEFAULTS = {
+    "name": "Wikidata",
+    "source_type": "database",
+    "priority": 75,
+    "url": "https://www.wikidata.org",
+}
+
+
+@pytest.mark.django_db
+class TestSourceEnsure:
+    def test_creates_missing_source(self):
+        source = Source.objects.ensure(slug="wikidata", defaults=DEFAULTS)
+        assert source.pk is not None
+        assert source.name == "Wikidata"
+        assert source.priority == 75
+
+    def test_unchanged_source_is_not_written(self):
+        original = Source.objects.ensure(slug="wikidata", defaults=DEFAULTS)
+        again = Source.objects.ensure(slug="wikidata", defaults=DEFAULTS)
+        assert again.pk == original.pk
+        assert again.updated_at == original.updated_at
+
+    def test_changed_fields_are_updated(self):
+        original = Source.objects.ensure(slug="wikidata", defaults=DEFAULTS)
+        updated = Source.objects.ensure(
+            slug="wikidata", defaults={**DEFAULTS, "priority": 80}
+        )
+        assert updated.pk == original.pk
+        assert Source.objects.get(pk=original.pk).priority == 80
+
+    def test_leaves_fields_outside_defaults_alone(self):
+        Source.objects.ensure(slug="wikidata", defaults=DEFAULTS)
+        Source.objects.filter(slug="wikidata").update(is_enabled=False)
+        source = Source.objects.ensure(slug="wikidata", defaults=DEFAULTS)
+        assert source.is_enabled is False